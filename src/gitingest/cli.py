@@ -1,19 +1,9 @@
-import os
-
 import click
 
 from gitingest.ingest import ingest
 from gitingest.ingest_from_query import MAX_FILE_SIZE
 
 
-def normalize_pattern(pattern: str) -> str:
-    pattern = pattern.strip()
-    pattern = pattern.lstrip(os.sep)
-    if pattern.endswith(os.sep):
-        pattern += "*"
-    return pattern
-
-
 @click.command()
 @click.argument("source", type=str, required=True)
 @click.option("--output", "-o", default=None, help="Output file path (default: <repo_name>.txt in current directory)")
@@ -1,4 +1,4 @@
-DEFAULT_IGNORE_PATTERNS: list[str] = [
+DEFAULT_IGNORE_PATTERNS: tuple[str, ...] = (
     # Python
     "*.pyc",
     "*.pyo",
@@ -157,4 +157,7 @@ DEFAULT_IGNORE_PATTERNS: list[str] = [
     "*.tfstate*",
     ## Dependencies in various languages
     "vendor/",
-]
+)
+
+# The defaults with repeated entries removed, in their original order
+UNIQUE_DEFAULT_IGNORE_PATTERNS: tuple[str, ...] = tuple(dict.fromkeys(DEFAULT_IGNORE_PATTERNS))
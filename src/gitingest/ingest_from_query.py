@@ -1,32 +1,72 @@
+import logging
 import os
-from fnmatch import fnmatch
+import re
+from collections.abc import Sequence
+from fnmatch import translate
+from functools import lru_cache
 from typing import Any
 
 import tiktoken
 
+from gitingest.ignore_patterns import UNIQUE_DEFAULT_IGNORE_PATTERNS
+
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10 MB
 MAX_DIRECTORY_DEPTH = 20  # Maximum depth of directory traversal
 MAX_FILES = 10_000  # Maximum number of files to process
 MAX_TOTAL_SIZE_BYTES = 500 * 1024 * 1024  # 500 MB
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=64)
+def _compile_patterns(patterns: tuple[str, ...]) -> tuple[frozenset[str], re.Pattern[str] | None]:
+    """
+    Splits patterns into literal names and a single compiled regex for the glob patterns.
+
+    Patterns are normalized with `os.path.normcase`, so matching a path normalized the same way
+    gives the same result as calling `fnmatch.fnmatch` with each pattern in turn.
+    """
+    literals = set()
+    globs = []
+    for pattern in patterns:
+        if not pattern:
+            continue
+        pattern = os.path.normcase(pattern)
+        if any(c in pattern for c in "*?["):
+            globs.append(translate(pattern))
+        else:
+            literals.add(pattern)
+
+    regex = re.compile("|".join(globs)) if globs else None
+    return frozenset(literals), regex
+
+
+# Compile the default ignore list once at import; parse_query returns exactly this list when nothing is added
+_compile_patterns(UNIQUE_DEFAULT_IGNORE_PATTERNS)
 
-def should_include(path: str, base_path: str, include_patterns: list[str]) -> bool:
+
+def _matches_any(rel_path: str, patterns: Sequence[str]) -> bool:
+    """Checks a relative path against all patterns with one set lookup and one regex match."""
+    literals, regex = _compile_patterns(tuple(patterns))
+    rel_path = os.path.normcase(rel_path)
+    return rel_path in literals or (regex is not None and regex.match(rel_path) is not None)
+
+
+def should_include(path: str, base_path: str, include_patterns: Sequence[str]) -> bool:
     rel_path = path.replace(base_path, "").lstrip(os.sep)
-    include = False
-    for pattern in include_patterns:
-        if fnmatch(rel_path, pattern):
-            include = True
-    return include
+    return _matches_any(rel_path, include_patterns)
 
 
-def should_exclude(path: str, base_path: str, ignore_patterns: list[str]) -> bool:
+def should_exclude(path: str, base_path: str, ignore_patterns: Sequence[str]) -> bool:
     rel_path = path.replace(base_path, "").lstrip(os.sep)
-    for pattern in ignore_patterns:
-        if pattern == "":
-            continue
-        if fnmatch(rel_path, pattern):
-            return True
-    return False
+    return _matches_any(rel_path, ignore_patterns)
+
+
+def _log_size_limit(stats: dict[str, int], msg: str, *args: Any) -> None:
+    """Logs the first total-size limit hit of a scan as a warning and any later ones at debug level."""
+    level = logging.DEBUG if stats.get("size_limit_hits") else logging.WARNING
+    stats["size_limit_hits"] = stats.get("size_limit_hits", 0) + 1
+    logger.log(level, msg, *args)
 
 
 def is_safe_symlink(symlink_path: str, base_path: str) -> bool:
@@ -72,20 +112,24 @@ def scan_directory(
         stats = {"total_files": 0, "total_size": 0}
 
     if depth > MAX_DIRECTORY_DEPTH:
-        print(f"Skipping deep directory: {path} (max depth {MAX_DIRECTORY_DEPTH} reached)")
+        logger.debug("Skipping deep directory: %s (max depth %d reached)", path, MAX_DIRECTORY_DEPTH)
         return None
 
     if stats["total_files"] >= MAX_FILES:
-        print(f"Skipping further processing: maximum file limit ({MAX_FILES}) reached")
+        logger.debug("Skipping further processing: maximum file limit (%d) reached", MAX_FILES)
         return None
 
     if stats["total_size"] >= MAX_TOTAL_SIZE_BYTES:
-        print(f"Skipping further processing: maximum total size ({MAX_TOTAL_SIZE_BYTES/1024/1024:.1f}MB) reached")
+        _log_size_limit(
+            stats,
+            "Skipping further processing: maximum total size (%.1fMB) reached",
+            MAX_TOTAL_SIZE_BYTES / 1024 / 1024,
+        )
         return None
 
     real_path = os.path.realpath(path)
     if real_path in seen_paths:
-        print(f"Skipping already visited path: {path}")
+        logger.debug("Skipping already visited path: %s", path)
         return None
 
     seen_paths.add(real_path)
@@ -101,44 +145,53 @@ def scan_directory(
         "ignore_content": False,
     }
 
-    ignore_patterns = query["ignore_patterns"]
+    # Tuples are reused as-is by the pattern cache lookups, so convert once per directory
+    ignore_patterns = tuple(query["ignore_patterns"])
     base_path = query["local_path"]
-    include_patterns = query["include_patterns"]
+    include_patterns = tuple(query["include_patterns"] or ())
+
+    # Bind per-item helpers locally to skip repeated module attribute lookups in the loop
+    join = os.path.join
+    isfile = os.path.isfile
+    isdir = os.path.isdir
+    islink = os.path.islink
+    realpath = os.path.realpath
+    getsize = os.path.getsize
 
     try:
         for item in os.listdir(path):
-            item_path = os.path.join(path, item)
+            item_path = join(path, item)
 
             if should_exclude(item_path, base_path, ignore_patterns):
                 continue
 
-            is_file = os.path.isfile(item_path)
+            is_file = isfile(item_path)
             if is_file and query["include_patterns"]:
                 if not should_include(item_path, base_path, include_patterns):
                     result["ignore_content"] = True
                     continue
 
             # Handle symlinks
-            if os.path.islink(item_path):
+            if islink(item_path):
                 if not is_safe_symlink(item_path, base_path):
-                    print(f"Skipping symlink that points outside base directory: {item_path}")
+                    logger.debug("Skipping symlink that points outside base directory: %s", item_path)
                     continue
-                real_path = os.path.realpath(item_path)
+                real_path = realpath(item_path)
                 if real_path in seen_paths:
-                    print(f"Skipping already visited symlink target: {item_path}")
+                    logger.debug("Skipping already visited symlink target: %s", item_path)
                     continue
 
-                if os.path.isfile(real_path):
-                    file_size = os.path.getsize(real_path)
+                if isfile(real_path):
+                    file_size = getsize(real_path)
                     if stats["total_size"] + file_size > MAX_TOTAL_SIZE_BYTES:
-                        print(f"Skipping file {item_path}: would exceed total size limit")
+                        _log_size_limit(stats, "Skipping file %s: would exceed total size limit", item_path)
                         continue
 
                     stats["total_files"] += 1
                     stats["total_size"] += file_size
 
                     if stats["total_files"] > MAX_FILES:
-                        print(f"Maximum file limit ({MAX_FILES}) reached")
+                        logger.warning("Maximum file limit (%d) reached", MAX_FILES)
                         return result
 
                     is_text = is_text_file(real_path)
@@ -155,7 +208,7 @@ def scan_directory(
                     result["size"] += file_size
                     result["file_count"] += 1
 
-                elif os.path.isdir(real_path):
+                elif isdir(real_path):
                     subdir = scan_directory(
                         path=real_path,
                         query=query,
@@ -172,17 +225,17 @@ def scan_directory(
                         result["dir_count"] += 1 + subdir["dir_count"]
                 continue
 
-            if os.path.isfile(item_path):
-                file_size = os.path.getsize(item_path)
+            if isfile(item_path):
+                file_size = getsize(item_path)
                 if stats["total_size"] + file_size > MAX_TOTAL_SIZE_BYTES:
-                    print(f"Skipping file {item_path}: would exceed total size limit")
+                    _log_size_limit(stats, "Skipping file %s: would exceed total size limit", item_path)
                     continue
 
                 stats["total_files"] += 1
                 stats["total_size"] += file_size
 
                 if stats["total_files"] > MAX_FILES:
-                    print(f"Maximum file limit ({MAX_FILES}) reached")
+                    logger.warning("Maximum file limit (%d) reached", MAX_FILES)
                     return result
 
                 is_text = is_text_file(item_path)
@@ -199,7 +252,7 @@ def scan_directory(
                 result["size"] += file_size
                 result["file_count"] += 1
 
-            elif os.path.isdir(item_path):
+            elif isdir(item_path):
                 subdir = scan_directory(
                     path=item_path,
                     query=query,
@@ -214,7 +267,7 @@ def scan_directory(
                     result["dir_count"] += 1 + subdir["dir_count"]
 
     except PermissionError:
-        print(f"Permission denied: {path}")
+        logger.warning("Permission denied: %s", path)
 
     return result
 
@@ -327,7 +380,7 @@ def generate_token_string(context_string: str) -> str | None:
         total_tokens = len(encoding.encode(context_string, disallowed_special=()))
 
     except Exception as e:
-        print(e)
+        logger.warning("Failed to count tokens: %s", e)
         return None
 
     if total_tokens > 1_000_000:
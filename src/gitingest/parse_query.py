@@ -1,33 +1,49 @@
 import os
+import re
 import string
-import uuid
+from functools import lru_cache
 from typing import Any
-from urllib.parse import unquote
+from urllib.parse import unquote, urlsplit
+from uuid import uuid4
 
-from gitingest.ignore_patterns import DEFAULT_IGNORE_PATTERNS
+from gitingest.ignore_patterns import UNIQUE_DEFAULT_IGNORE_PATTERNS
 
 TMP_BASE_PATH = "../tmp"
-HEX_DIGITS = set(string.hexdigits)
+_TMP_PREFIX = TMP_BASE_PATH + "/"
+KNOWN_HOST_PREFIXES = ("https://github.com/", "https://gitlab.com/")
+ALLOWED_PATTERN_CHARS = frozenset(string.ascii_letters + string.digits + "-_./+*")
+_STRIP_ALLOWED_CHARS = str.maketrans("", "", "".join(ALLOWED_PATTERN_CHARS))
+_COMMIT_HASH_RE = re.compile(r"[0-9a-fA-F]{40}")
+_SCHEME_RE = re.compile(r"https?://")
+_URL_RE = re.compile(r"^https?://|github\.com")
 
 
 def parse_url(url: str) -> dict[str, Any]:
     url = url.split(" ")[0]
-    url = unquote(url)  # Decode URL-encoded characters
 
-    if not url.startswith("https://"):
+    if not _SCHEME_RE.match(url):
         url = "https://" + url
 
-    # Extract domain and path
-    url_parts = url.split("/")
-    domain = url_parts[2]
-    path_parts = url_parts[3:]
+    # Extract domain and path, skipping urlsplit for plain URLs on well-known hosts
+    if url.startswith(KNOWN_HOST_PREFIXES) and "?" not in url and "#" not in url:
+        domain, _, path = url[len("https://") :].partition("/")
+    else:
+        split_url = urlsplit(url)
+        # Drop any userinfo so credentials never end up in the clone URL
+        domain, path = split_url.netloc.rpartition("@")[2], split_url.path
+
+    # Decode only after splitting, so an encoded "?" or "#" stays part of the path
+    path = unquote(path)
+
+    # At most 5 parts: user, repo, type, branch/commit and the remaining subpath
+    path_parts = path.lstrip("/").split("/", 4)
 
     if len(path_parts) < 2:
         raise ValueError("Invalid repository URL. Please provide a valid Git repository URL.")
 
     user_name = path_parts[0]
     repo_name = path_parts[1]
-    _id = str(uuid.uuid4())
+    _id = uuid4().hex
     slug = f"{user_name}-{repo_name}"
 
     parsed = {
@@ -37,7 +53,7 @@ def parse_url(url: str) -> dict[str, Any]:
         "branch": None,
         "commit": None,
         "subpath": "/",
-        "local_path": f"{TMP_BASE_PATH}/{_id}/{slug}",
+        "local_path": _TMP_PREFIX + _id + "/" + slug,
         "url": f"https://{domain}/{user_name}/{repo_name}",
         "slug": slug,
         "id": _id,
@@ -53,22 +69,18 @@ def parse_url(url: str) -> dict[str, Any]:
     parsed["type"] = path_parts[2]  # Usually 'tree' or 'blob'
     commit = path_parts[3]
 
-    if _is_valid_git_commit_hash(commit):
+    if _COMMIT_HASH_RE.fullmatch(commit):
         parsed["commit"] = commit
-        if len(path_parts) > 4:
-            parsed["subpath"] += "/".join(path_parts[4:])
     else:
         parsed["branch"] = commit
-        if len(path_parts) > 4:
-            parsed["subpath"] += "/".join(path_parts[4:])
-
-    return parsed
 
+    if len(path_parts) > 4:
+        parsed["subpath"] += path_parts[4]
 
-def _is_valid_git_commit_hash(commit: str) -> bool:
-    return len(commit) == 40 and all(c in HEX_DIGITS for c in commit)
+    return parsed
 
 
+@lru_cache(maxsize=1024)
 def normalize_pattern(pattern: str) -> str:
     pattern = pattern.lstrip(os.sep)
     if pattern.endswith(os.sep):
@@ -76,23 +88,36 @@ def normalize_pattern(pattern: str) -> str:
     return pattern
 
 
-def parse_patterns(pattern: list[str] | str) -> list[str]:
-    patterns = pattern if isinstance(pattern, list) else [pattern]
+def parse_patterns(pattern: list[str] | str | None) -> list[str]:
+    if not pattern:
+        return []
+
+    # Lists are unhashable, so convert to a tuple before hitting the cache
+    key = tuple(pattern) if isinstance(pattern, list) else pattern
+    return list(_parse_patterns_cached(key))
+
+
+@lru_cache(maxsize=256)
+def _parse_patterns_cached(pattern: tuple[str, ...] | str) -> tuple[str, ...]:
+    patterns = pattern if isinstance(pattern, tuple) else (pattern,)
     patterns = [p.strip() for p in patterns]
 
     for p in patterns:
-        if not all(c.isalnum() or c in "-_./+*" for c in p):
+        # Whatever survives the translate is either non-ASCII alphanumeric or invalid
+        leftover = p.translate(_STRIP_ALLOWED_CHARS)
+        if leftover and not leftover.isalnum():
+            bad_char = next(c for c in leftover if not c.isalnum())
             raise ValueError(
-                f"Pattern '{p}' contains invalid characters. Only alphanumeric characters, dash (-), "
+                f"Pattern '{p}' contains invalid characters ({bad_char!r}). Only alphanumeric characters, dash (-), "
                 "underscore (_), dot (.), forward slash (/), plus (+), and asterisk (*) are allowed."
             )
 
-    return [normalize_pattern(p) for p in patterns]
+    return tuple(normalize_pattern(p) for p in patterns)
 
 
 def override_ignore_patterns(ignore_patterns: list[str], include_patterns: list[str]) -> list[str]:
     """
-    Removes patterns from ignore_patterns that are present in include_patterns using set difference.
+    Removes patterns from ignore_patterns that are present in include_patterns, preserving order.
 
     Parameters
     ----------
@@ -106,16 +131,20 @@ def override_ignore_patterns(ignore_patterns: list[str], include_patterns: list[
     List[str]
         A new list of ignore_patterns with specified patterns removed.
     """
-    return list(set(ignore_patterns) - set(include_patterns))
+    include = set(include_patterns)
+    return [pattern for pattern in ignore_patterns if pattern not in include]
 
 
 def parse_path(path: str) -> dict[str, Any]:
+    local_path = os.path.abspath(path)
+    # One split from the right gives both the parent and the directory name
+    parts = local_path.rsplit(os.sep, 2)
     query = {
         "url": None,
-        "local_path": os.path.abspath(path),
-        "slug": os.path.basename(os.path.dirname(path)) + "/" + os.path.basename(path),
+        "local_path": local_path,
+        "slug": f"{parts[-2]}/{parts[-1]}" if len(parts) >= 2 else parts[-1],
         "subpath": "/",
-        "id": str(uuid.uuid4()),
+        "id": uuid4().hex,
     }
     return query
 
@@ -150,15 +179,15 @@ def parse_query(
         'ignore_patterns', and 'include_patterns'.
     """
     # Determine the parsing method based on the source type
-    if from_web or source.startswith("https://") or "github.com" in source:
+    if from_web or _URL_RE.search(source):
         query = parse_url(source)
     else:
         query = parse_path(source)
 
     # Process ignore patterns
-    ignore_patterns_list = DEFAULT_IGNORE_PATTERNS.copy()
-    if ignore_patterns:
-        ignore_patterns_list += parse_patterns(ignore_patterns)
+    user_ignore_patterns = parse_patterns(ignore_patterns)
+    # Drop duplicates (user patterns often repeat defaults) while keeping the original order
+    ignore_patterns_list = list(dict.fromkeys([*UNIQUE_DEFAULT_IGNORE_PATTERNS, *user_ignore_patterns]))
 
     # Process include patterns and override ignore patterns accordingly
     if include_patterns:
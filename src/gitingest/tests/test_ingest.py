@@ -1,9 +1,17 @@
+import logging
+from fnmatch import fnmatch
 from pathlib import Path
 from typing import Any
 
 import pytest
 
-from gitingest.ingest_from_query import extract_files_content, scan_directory
+from gitingest.ingest_from_query import (
+    MAX_TOTAL_SIZE_BYTES,
+    extract_files_content,
+    scan_directory,
+    should_exclude,
+)
+from gitingest.parse_query import parse_query
 
 
 # Test fixtures
@@ -102,7 +110,44 @@ def test_extract_files_content(temp_directory: Path, sample_query: dict[str, Any
     assert any("file_dir2.txt" in p for p in paths)
 
 
-# TODO: test with include patterns: ['*.txt']
+def test_scan_directory_include_patterns(temp_directory: Path) -> None:
+    query = parse_query(str(temp_directory), max_file_size=1_000_000, from_web=False, include_patterns="*.txt")
+    result = scan_directory(str(temp_directory), query=query)
+    if result is None:
+        assert False, "Result is None"
+
+    assert result["file_count"] == 5  # All .txt files
+
+
+def test_scan_directory_reads_current_ignore_patterns(temp_directory: Path) -> None:
+    query = parse_query(str(temp_directory), max_file_size=1_000_000, from_web=False)
+    query["ignore_patterns"].append("src")
+    result = scan_directory(str(temp_directory), query=query)
+    if result is None:
+        assert False, "Result is None"
+
+    assert result["file_count"] == 4  # src/ and its files are skipped
+
+
+def test_should_exclude_matches_fnmatch() -> None:
+    patterns = ["*.txt", "node_modules", "*.tfstate*", "**/*.rs.bk", ""]
+    for name in ["notes.txt", "node_modules", "src/node_modules", "state.tfstate.backup", "a/b.rs.bk", "main.py"]:
+        expected = any(fnmatch(name, p) for p in patterns if p)
+        assert should_exclude(name, "", patterns) == expected
+
+
+def test_scan_directory_warns_once_on_size_limit(
+    temp_directory: Path, sample_query: dict[str, Any], caplog: pytest.LogCaptureFixture
+) -> None:
+    stats = {"total_files": 0, "total_size": MAX_TOTAL_SIZE_BYTES}
+    with caplog.at_level(logging.DEBUG, logger="gitingest.ingest_from_query"):
+        scan_directory(str(temp_directory), query=sample_query, stats=stats)
+        scan_directory(str(temp_directory / "src"), query=sample_query, stats=stats)
+
+    size_records = [r for r in caplog.records if "total size" in r.getMessage()]
+    assert [r.levelno for r in size_records] == [logging.WARNING, logging.DEBUG]
+
+
 # TODO: test with wrong include patterns: ['*.qwerty']
 
 